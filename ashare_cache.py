@@ -0,0 +1,46 @@
+# Ashare行情磁盘缓存 - 同参数的重复请求直接读本地文件,省掉网络往返(脚本主要开销是I/O不是计算)
+import functools, hashlib, os, time
+from collections import namedtuple
+from datetime import date, datetime, timedelta
+import numpy as np; import pandas as pd
+from Ashare import get_price
+
+CACHE_DIR = os.path.expanduser('~/.cache/ashare')
+
+OHLCV = namedtuple('OHLCV', 'open high low close volume')   #五个连续float64一维数组
+
+def cached_get_price(code, **kwargs):
+    '''get_price的磁盘缓存包装: 键=sha1(code|参数), 命中直接读本地文件
+       未指定end_date(实时模式)时缓存超过1个交易日即失效重新拉取'''
+    key = hashlib.sha1(f'{code}|{sorted(kwargs.items())}'.encode()).hexdigest()
+    path = os.path.join(CACHE_DIR, key + '.pkl')
+    if os.path.exists(path):
+        if kwargs.get('end_date') or time.time() - os.path.getmtime(path) < 86400:
+            try:    return pd.read_pickle(path)
+            except Exception: pass                   #缓存文件损坏就当未命中,重新拉取
+    df = get_price(code, **kwargs)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    df.to_pickle(path)
+    return df
+
+def get_price_raw(code, **kwargs):
+    '''热路径取数: 只需要NumPy数组时跳过DataFrame层,直接返回OHLCV元组
+       取一次DataFrame后整块转成连续float64,五个字段都是单位步长视图'''
+    df = cached_get_price(code, **kwargs)
+    arr = np.ascontiguousarray(df[['open','high','low','close','volume']].to_numpy(dtype=np.float64).T)
+    return OHLCV(*arr)
+
+_today_ord = date.today().toordinal()            #跨过午夜时整表失效
+
+@functools.lru_cache(maxsize=8)
+def _format_end_date(offset_days):
+    return (datetime.now() - timedelta(days=offset_days)).strftime('%Y-%m-%d')
+
+def end_date(offset_days):
+    '''"今天往前offset_days天"的日期串,结果按天记忆化(扫描循环里免去重复的now/strftime)'''
+    global _today_ord
+    today = date.today().toordinal()
+    if today != _today_ord:                      #过了午夜就清缓存重算
+        _format_end_date.cache_clear()
+        _today_ord = today
+    return _format_end_date(offset_days)
@@ -0,0 +1,109 @@
+# BOLL走势分析 - test-zhongxinjinshu.py 与 test-zhongxinjinshu-history.py 共用的分析打印逻辑
+# 数值部分走bollsig内核(有numba时JIT,每进程只编译/预热一次),这里负责中文输出
+import sys
+import numpy as np
+from boll_incremental import boll_tail
+from bollsig import (analyze, SIG_BREAK_UP, SIG_FALL_UP, SIG_BREAK_LOWER,
+                     SIG_BOUNCE, SIG_CROSS_MID, SIG_LOSE_MID)
+
+#预编译的输出查表,用bollsig返回的整数码直接索引,不走分支树
+_POSITION = ("上轨之上 🚨 超买区域", "中轨与上轨之间 📈 强势区域",
+             "中轨与下轨之间 📉 弱势区域", "下轨之下 🚨 超卖区域")
+_TREND = ("开口扩大 🔥 波动加剧，趋势可能启动", "收口收窄 😴 波动减小，可能变盘",
+          "开口平稳 ➡️ 震荡行情")
+_MID_TREND = ("向上 📈", "向下 📉", "走平 ➡️")
+_CROSS_SIGNALS = ((SIG_BREAK_UP,    "⚡ 突破上轨 - 强势启动"),       #穿越信号按掩码位查表
+                  (SIG_FALL_UP,     "⚡ 上轨回落 - 超买回调"),       #内核保证轨道位0-3互斥
+                  (SIG_BREAK_LOWER, "⚡ 跌破下轨 - 恐慌抛售"),       #中轨位4-5互斥
+                  (SIG_BOUNCE,      "⚡ 下轨反弹 - 超卖企稳"),
+                  (SIG_CROSS_MID,   "🔄 上穿中轨 - 趋势转强"),
+                  (SIG_LOSE_MID,    "🔄 跌破中轨 - 趋势转弱"))
+_PCTB_TEMPLATES = ("📊 逼近下轨({:.1%}) - 支撑区，关注反弹",      #bucket=int(percent_b*10)截断到[0,9]
+                   "📊 弱势区({:.1%}) - 通道下半部运行",
+                   "📊 弱势区({:.1%}) - 通道下半部运行",
+                   "📊 中性偏弱({:.1%}) - 靠近中轨下方",
+                   "📊 中性偏弱({:.1%}) - 靠近中轨下方",
+                   "📊 中性偏强({:.1%}) - 靠近中轨上方",
+                   "📊 中性偏强({:.1%}) - 靠近中轨上方",
+                   "📊 强势区({:.1%}) - 通道上半部运行",
+                   "📊 强势区({:.1%}) - 通道上半部运行",
+                   "📊 逼近上轨({:.1%}) - 高压区，谨慎追高")
+
+def analyze_and_print(data, N=20, detailed=True):
+    '''打印BOLL状态分析与交易信号参考
+       data: 行情DataFrame(取close列)或收盘价序列
+       detailed=True时追加综合操作建议
+       作图需要整段布林带时调用方自取boll_incremental(CLOSE)'''
+    CLOSE = np.ascontiguousarray(data.close if hasattr(data, 'close') else data, dtype=np.float64)
+
+    if len(CLOSE) < N + 4:                       #一次性前置校验:保证-5索引和bollsig窗口都有效,后面全是直线代码
+        print("数据不足，无法生成信号")
+        return
+
+    up, mid, lower = boll_tail(CLOSE, N)         #信号只看末端5根,不生成整段布林带
+    (position_code, trend_code, mid_trend_code, percent_b, width_change,
+     above_mid, signal_mask) = analyze(CLOSE, N)
+
+    # 1. 当前股价与布林带位置关系
+    current_price = CLOSE[-1]
+    current_up = up[-1]
+    current_mid = mid[-1]
+    current_lower = lower[-1]
+
+    print(f"\n=== 当前BOLL状态分析 ===")
+    print(f"最新收盘价: {current_price:.2f}")
+    print(f"布林上轨: {current_up:.2f}")
+    print(f"布林中轨: {current_mid:.2f}")
+    print(f"布林下轨: {current_lower:.2f}")
+
+    # 2-4. 所在区域/开口收口/中轨趋势: 整数码查表输出
+    current_width = (current_up - current_lower) / current_mid
+    print(f"当前位置: {_POSITION[position_code]}")
+    print(f"带宽状态: {current_width:.4f} - {_TREND[trend_code]}")
+    print(f"中轨趋势: {_MID_TREND[mid_trend_code]}")
+
+    # ================== 交易信号参考 ==================
+    print(f"\n=== 交易信号参考 ===")
+
+    # 1-2. 轨道/中轨穿越信号: 内核已把八个比较打包成位掩码,这里按位查表
+    signals = [None] * 8;  n_sig = 0             #各分支合计最多8条,预分配槽位免列表扩容
+    for bit, text in _CROSS_SIGNALS:
+        if signal_mask & bit:
+            signals[n_sig] = text;  n_sig += 1
+
+    # 3. 轨道内位置信号(没有穿越信号时显示位置状态,解决"无信号"问题)
+    if n_sig == 0:
+        #%B分桶直接索引模板,免掉分支级联; NaN(带宽退化等异常输入)按基线行为落到桶0
+        bucket = min(9, max(0, int(percent_b * 10))) if percent_b == percent_b else 0
+        signals[n_sig] = _PCTB_TEMPLATES[bucket].format(percent_b);  n_sig += 1
+
+    # 4. 带宽状态信号
+    if width_change > 1.1:
+        signals[n_sig] = "🔥 布林带开口扩大 - 波动加剧，趋势将延续";  n_sig += 1
+    elif width_change < 0.9:
+        signals[n_sig] = "😴 布林带收口 - 波动收敛，即将变盘";  n_sig += 1
+
+    # 5. 连续N日位置信号
+    if above_mid >= 4:
+        signals[n_sig] = f"📈 强势延续 - 近5日有{above_mid}日收在中轨上方";  n_sig += 1
+    elif above_mid <= 1:
+        signals[n_sig] = f"📉 弱势延续 - 近5日有{5-above_mid}日收在中轨下方";  n_sig += 1
+
+    # 输出所有信号(拼成一段一次write,N次print系统调用变1次)
+    if n_sig:
+        sys.stdout.write('\n'.join(signals[:n_sig]) + '\n')
+    else:
+        print("➖ 轨道突破: 暂无穿越信号")
+
+    # 6. 操作建议（综合）
+    if detailed:
+        print(f"\n=== 操作建议 ===")
+        if percent_b > 0.9 and width_change > 1.05:
+            print("建议: 持仓者考虑减仓，空仓者观望")
+        elif percent_b < 0.1 and width_change > 1.05:
+            print("建议: 关注反弹机会，可轻仓试多")
+        elif 0.3 < percent_b < 0.7 and width_change < 0.9:
+            print("建议: 震荡行情，高抛低吸或观望")
+        else:
+            print("建议: 跟随趋势，中轨上方偏多，中轨下方偏空")
+
@@ -0,0 +1,21 @@
+# 多标的批量BOLL信号 - 把逐票Python循环换成一次(S,T)二维广播计算,扫描几百上千只票时用
+import numpy as np; import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+def evaluate_boll_batch(CLOSE_2d, N=20, k=2, symbols=None):
+    '''对形状(S,T)的收盘价矩阵一次算出全部标的的BOLL信号要素 (S个标的,T根K线,T>=N+4)
+       单标的传 CLOSE[None,:] 即可。返回按标的一行的DataFrame:
+       close/up/mid/lower为最新值, percent_b %B位置, width_change带宽5日变化, above_mid近5日收在中轨上方天数'''
+    C = np.ascontiguousarray(np.atleast_2d(CLOSE_2d), dtype=np.float64)
+    win = sliding_window_view(C, N, axis=1)          #(S, T-N+1, N)个滚动窗口(零拷贝视图)
+    mid = win.mean(-1);  sd = win.std(-1)            #各窗口均值/总体标准差
+    up = mid + k*sd;  lower = mid - k*sd
+    span = up[:,-1] - lower[:,-1]                    #带宽为零(停牌/一字板)时%B取中性0.5,变化取1
+    percent_b = np.where(span > 0, (C[:,-1] - lower[:,-1]) / np.where(span > 0, span, 1), 0.5)
+    width = (up - lower) / mid
+    w4 = width[:,-5]
+    width_change = np.where(w4 > 0, width[:,-1] / np.where(w4 > 0, w4, 1), 1.0)
+    above_mid = (C[:,-5:] > mid[:,-5:]).sum(axis=1)  #近5日收在中轨上方的天数
+    return pd.DataFrame({'close': C[:,-1], 'up': up[:,-1], 'mid': mid[:,-1], 'lower': lower[:,-1],
+                         'percent_b': percent_b, 'width_change': width_change, 'above_mid': above_mid},
+                        index=symbols)
@@ -0,0 +1,35 @@
+# 增量式BOLL计算 - 滚动窗口只维护运行和与平方和，每根新K线O(1)更新
+# 与 MyTT.BOLL(CLOSE,N,P) 等价(std为总体标准差ddof=0)，但把O(N·W)的重复计算降为O(N)
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+def boll_incremental(CLOSE, N=20, k=2):
+    '''增量式布林带: 维护窗口内运行和s与平方和s2，出窗减、入窗加，逐根推进
+       平方和用Kahan补偿求和，避免价格大、方差小时的灾难性抵消
+       返回 (up, mid, lower) 三个与CLOSE等长的序列，前N-1个为NaN'''
+    C = np.ascontiguousarray(CLOSE, dtype=np.float64)
+    T = len(C)
+    up = np.empty(T); mid = np.empty(T); lower = np.empty(T)
+    up[:N-1] = np.nan;  mid[:N-1] = np.nan;  lower[:N-1] = np.nan
+    s = 0.0;  s2 = 0.0;  c2 = 0.0                   #s运行和 s2平方和 c2为Kahan补偿项
+    for i in range(T):
+        y = C[i]*C[i] - c2;  t = s2 + y;  c2 = (t - s2) - y;  s2 = t    #入窗样本
+        s += C[i]
+        if i >= N:                                                      #出窗样本
+            o = C[i-N]
+            y = -o*o - c2;   t = s2 + y;  c2 = (t - s2) - y;  s2 = t
+            s -= o
+        if i >= N-1:
+            m = s / N
+            var = s2 / N - m*m
+            sd = np.sqrt(var) if var > 0 else 0.0    #浮点误差可能使var略小于0
+            mid[i] = m;  up[i] = m + k*sd;  lower[i] = m - k*sd
+    return up, mid, lower
+
+def boll_tail(CLOSE, N=20, tail=5, k=2):
+    '''只算末端tail根K线的布林带: 信号判断只看-1/-5处的值,不必生成整段序列
+       要求 len(CLOSE) >= N+tail-1, 返回三个长度为tail的数组 (up, mid, lower)'''
+    C = np.ascontiguousarray(CLOSE[-(N+tail-1):], dtype=np.float64)
+    win = sliding_window_view(C, N)              #(tail, N)个滚动窗口(零拷贝视图)
+    m = win.mean(-1);  sd = win.std(-1)          #总体标准差,与boll_incremental一致
+    return m + k*sd, m, m - k*sd
@@ -0,0 +1,72 @@
+# BOLL信号数值内核 - 把位置判断/带宽/中轨斜率/%B/穿越检测融合为对CLOSE的单次扫描
+# 装numba时整个内核JIT成机器码(扫描几千只票时省去逐操作的Python分发)，没装则原样运行
+# 中文描述在调用方用整数码查表输出，内核只算数
+import numpy as np
+
+try:
+    from numba import njit                       #可选依赖:未列入requirements.lock
+except ImportError:                              #没有numba就原样跑纯Python
+    def njit(*args, **kwargs):
+        def wrap(func): return func
+        return wrap
+
+#信号掩码位定义(signal_mask)
+SIG_BREAK_UP    = 1 << 0     #突破上轨
+SIG_FALL_UP     = 1 << 1     #上轨回落
+SIG_BREAK_LOWER = 1 << 2     #跌破下轨
+SIG_BOUNCE      = 1 << 3     #下轨反弹
+SIG_CROSS_MID   = 1 << 4     #上穿中轨
+SIG_LOSE_MID    = 1 << 5     #跌破中轨
+
+@njit(cache=True, fastmath=True)
+def analyze(CLOSE, N=20):
+    '''单次扫描计算BOLL信号要素，要求 len(CLOSE) >= N+4
+       返回 (position_code, trend_code, mid_trend_code, percent_b, width_change, above_mid, signal_mask)
+       position_code:  0上轨之上 1中上轨间 2中下轨间 3下轨之下
+       trend_code:     0开口扩大 1收口收窄 2开口平稳
+       mid_trend_code: 0向上 1向下 2走平'''
+    T = CLOSE.shape[0]
+    up = np.empty(T); mid = np.empty(T); lower = np.empty(T)
+    s = 0.0; s2 = 0.0                            #运行和/平方和,同boll_incremental
+    for i in range(T):
+        s += CLOSE[i];  s2 += CLOSE[i]*CLOSE[i]
+        if i >= N:
+            o = CLOSE[i-N];  s -= o;  s2 -= o*o
+        if i >= N-1:
+            m = s / N
+            var = s2 / N - m*m
+            sd = np.sqrt(var) if var > 0 else 0.0
+            mid[i] = m;  up[i] = m + 2*sd;  lower[i] = m - 2*sd
+
+    c0 = CLOSE[T-1];  c1 = CLOSE[T-2]
+    u0 = up[T-1];   m0 = mid[T-1];   l0 = lower[T-1]
+    u1 = up[T-2];   m1 = mid[T-2];   l1 = lower[T-2]
+    u4 = up[T-5];   m4 = mid[T-5];   l4 = lower[T-5]
+
+    position_code = 0 if c0 > u0 else 1 if c0 > m0 else 2 if c0 > l0 else 3
+
+    w0 = (u0 - l0) / m0;  w4 = (u4 - l4) / m4    #带宽开口/收口
+    width_change = w0 / w4 if w4 > 0 else 1.0    #带宽为零(如停牌/一字板)视为无变化,不产生NaN/inf
+    trend_code = 0 if w0 > w4 * 1.05 else 1 if w0 < w4 * 0.95 else 2
+
+    mid_slope = m0 - m4                          #中轨趋势
+    mid_trend_code = 0 if mid_slope > 0 else 1 if mid_slope < 0 else 2
+
+    percent_b = (c0 - l0) / (u0 - l0) if u0 > l0 else 0.5    #上下轨重合时取中性0.5,避免0/0=NaN
+
+    above_mid = 0                                #近5日收在中轨上方的天数
+    for j in range(T-5, T):
+        if CLOSE[j] > mid[j]: above_mid += 1
+
+    signal_mask = 0                              #穿越信号打包成位掩码
+    if   c1 <= u1 and c0 > u0: signal_mask |= 1      #SIG_BREAK_UP
+    elif c1 >= u1 and c0 < u0: signal_mask |= 2      #SIG_FALL_UP
+    elif c1 >= l1 and c0 < l0: signal_mask |= 4      #SIG_BREAK_LOWER
+    elif c1 <= l1 and c0 > l0: signal_mask |= 8      #SIG_BOUNCE
+    if   c1 <= m1 and c0 > m0: signal_mask |= 16     #SIG_CROSS_MID
+    elif c1 >= m1 and c0 < m0: signal_mask |= 32     #SIG_LOSE_MID
+
+    return (np.int8(position_code), np.int8(trend_code), np.int8(mid_trend_code),
+            percent_b, width_change, np.int32(above_mid), np.uint32(signal_mask))
+
+analyze(np.arange(30.0))                         #导入时预热,JIT只编译一次